@@ -1,16 +1,20 @@
 import logging
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, HTTPException, Depends
 from fastapi.params import Security
-from fastapi_pagination.ext.sqlalchemy import paginate
-from fastapi_pagination import Page, Params
+from fastapi_pagination import Params, create_page
 from fastapi_pagination.bases import AbstractPage
 from pydantic import ValidationError, conlist
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+from starlette.concurrency import run_in_threadpool
 from starlette.status import HTTP_404_NOT_FOUND
 
 from fidesops.common_exceptions import ConnectionException, KeyOrNameAlreadyExists
+from fidesops.db.base_class import get_key_from_data
 from fidesops.schemas.connection_configuration import (
     get_connection_secrets_validator,
     connection_secrets_schemas,
@@ -23,7 +27,6 @@ from fidesops.schemas.connection_configuration.connection_secrets import (
 from fidesops.service.connectors import get_connector
 from fidesops.schemas.api import BulkUpdateFailed
 from fidesops.schemas.connection_configuration.connection_config import (
-    ConnectionConfigurationResponse,
     CreateConnectionConfiguration,
     BulkPutConnectionConfiguration,
 )
@@ -48,39 +51,90 @@ router = APIRouter(tags=["Connections"], prefix=V1_URL_PREFIX)
 
 logger = logging.getLogger(__name__)
 
+# The read endpoints select just the response columns rather than hydrating
+# full ORM instances, which would also AES-decrypt the secrets blob per row
+CONNECTION_CONFIG_RESPONSE_COLUMNS = (
+    ConnectionConfig.name,
+    ConnectionConfig.key,
+    ConnectionConfig.connection_type,
+    ConnectionConfig.access,
+    ConnectionConfig.created_at,
+    ConnectionConfig.updated_at,
+    ConnectionConfig.last_test_timestamp,
+    ConnectionConfig.last_test_succeeded,
+)
+
+# Constrained list type for the bulk PUT payload, built once at import. Its
+# length validator runs before per-item validation, so over-limit payloads
+# fail fast without validating each of the 50+ items.
+CreateConnectionConfigurations = conlist(CreateConnectionConfiguration, max_items=50)
+
 
 @router.get(
     CONNECTIONS,
     dependencies=[Security(verify_oauth_client, scopes=[CONNECTION_READ])],
-    response_model=Page[ConnectionConfigurationResponse],
 )
-def get_connections(
+async def get_connections(
     *, db: Session = Depends(deps.get_db), params: Params = Depends()
 ) -> AbstractPage[ConnectionConfig]:
-    """Returns all connection configurations in the database."""
+    """Returns all connection configurations in the database.
+
+    Handlers here are async so requests stay on the event loop; the blocking
+    session work runs on the threadpool via run_in_threadpool."""
     logger.info(
         f"Finding all connection configurations with pagination params {params}"
     )
-    return paginate(ConnectionConfig.query(db), params=params)
+    return await run_in_threadpool(_paginate_connection_configs, db, params)
+
+
+def _paginate_connection_configs(db: Session, params: Params) -> AbstractPage:
+    """Deferred-join pagination: page through the indexed id column first,
+    then fetch the response columns for just that page, so large offsets
+    never scan full rows. A cursor-based contract was considered but every
+    list endpoint here exposes the fastapi-pagination Page shape."""
+    raw_params = params.to_raw_params()
+    total = db.query(ConnectionConfig.id).count()
+    page_ids = [
+        row.id
+        for row in db.query(ConnectionConfig.id)
+        .order_by(ConnectionConfig.id)
+        .limit(raw_params.limit)
+        .offset(raw_params.offset)
+    ]
+    items = []
+    if page_ids:
+        items = [
+            row._asdict()
+            for row in db.query(*CONNECTION_CONFIG_RESPONSE_COLUMNS)
+            .filter(ConnectionConfig.id.in_(page_ids))
+            .order_by(ConnectionConfig.id)
+        ]
+    return create_page(items, total, params)
 
 
 @router.get(
     CONNECTION_BY_KEY,
     dependencies=[Security(verify_oauth_client, scopes=[CONNECTION_READ])],
-    response_model=ConnectionConfigurationResponse,
 )
-def get_connection_detail(
+async def get_connection_detail(
     connection_key: str, db: Session = Depends(deps.get_db)
-) -> ConnectionConfig:
-    """Returns connection configuration with matching key."""
-    connection_config = ConnectionConfig.get_by(db, field="key", value=connection_key)
+) -> Dict[str, Any]:
+    """Returns connection configuration with matching key.
+
+    The row's columns already match the response shape, so the dict is
+    returned directly rather than re-validated through a response model."""
+    connection_config = await run_in_threadpool(
+        db.query(*CONNECTION_CONFIG_RESPONSE_COLUMNS)
+        .filter(ConnectionConfig.key == connection_key)
+        .first
+    )
     logger.info(f"Finding connection configuration with key '{connection_key}'")
     if not connection_config:
         raise HTTPException(
             status_code=HTTP_404_NOT_FOUND,
             detail=f"No connection configuration with key '{connection_key}'.",
         )
-    return connection_config
+    return connection_config._asdict()
 
 
 @router.put(
@@ -89,10 +143,10 @@ def get_connection_detail(
     status_code=200,
     response_model=BulkPutConnectionConfiguration,
 )
-def put_connections(
+async def put_connections(
     *,
     db: Session = Depends(deps.get_db),
-    configs: conlist(CreateConnectionConfiguration, max_items=50),  # type: ignore
+    configs: CreateConnectionConfigurations,  # type: ignore
 ) -> BulkPutConnectionConfiguration:
     """
     Given a list of connection config data elements, create or update corresponding ConnectionConfig objects
@@ -103,15 +157,173 @@ def put_connections(
 
     Note that ConnectionConfiguration.secrets are not updated through this endpoint.
     """
+    logger.info(f"Starting bulk upsert for {len(configs)} connection configuration(s)")
+    return await run_in_threadpool(_bulk_create_or_update_connections, db, configs)
+
+
+def _bulk_create_or_update_connections(
+    db: Session,
+    configs: List[CreateConnectionConfiguration],
+) -> BulkPutConnectionConfiguration:
+    """Create or update each of the given connection configurations,
+    collecting failures per row.
+
+    The batch is persisted with a constant number of statements; only if that
+    fails do we fall back to per-row handling to report which rows were at
+    fault."""
+    # One SELECT over all supplied keys replaces the per-row existence probes:
+    # rows whose key is already present are updates, the rest are creates
+    datas = [config.dict() for config in configs]
+    supplied_keys = [data["key"] for data in datas if data["key"]]
+    existing_keys = set()
+    if supplied_keys:
+        existing_keys = {
+            key
+            for (key,) in db.query(ConnectionConfig.key).filter(
+                ConnectionConfig.key.in_(supplied_keys)
+            )
+        }
+    updates: List[Dict] = []
+    creates: List[Dict] = []
+    create_indices: List[int] = []
+    for i, data in enumerate(datas):
+        if data["key"] in existing_keys:
+            updates.append(data)
+        else:
+            # Build properly formatted keys the same way per-row creation does
+            data["key"] = get_key_from_data(data, ConnectionConfig.__name__)
+            creates.append(data)
+            create_indices.append(i)
+
+    # Two more IN (...) SELECTs diff the create rows against existing keys and
+    # names in memory, so known collisions fail per row up front instead of
+    # failing the whole bulk transaction
+    failed: List[BulkUpdateFailed] = []
+    replayed: List[ConnectionConfig] = []
+    if creates:
+        colliding_keys = {
+            key
+            for (key,) in db.query(ConnectionConfig.key).filter(
+                ConnectionConfig.key.in_([data["key"] for data in creates])
+            )
+        }
+        colliding_names = {
+            name
+            for (name,) in db.query(ConnectionConfig.name).filter(
+                ConnectionConfig.name.in_([data["name"] for data in creates])
+            )
+        }
+        collisions = [
+            (i, data)
+            for i, data in zip(create_indices, creates)
+            if data["key"] in colliding_keys or data["name"] in colliding_names
+        ]
+        if collisions:
+            collision_ids = {id(data) for _, data in collisions}
+            creates = [data for data in creates if id(data) not in collision_ids]
+            datas = [data for data in datas if id(data) not in collision_ids]
+            for i, _ in collisions:
+                # Replay the row through create to surface the canonical
+                # KeyOrNameAlreadyExists message; only colliding rows pay this
+                orig_data = configs[i].dict()
+                try:
+                    replayed.append(
+                        ConnectionConfig.create(db=db, data=orig_data.copy())
+                    )
+                except KeyOrNameAlreadyExists as exc:
+                    logger.warning(
+                        f"Create/update failed for connection config with key '{configs[i].key}': {exc}"
+                    )
+                    failed.append(
+                        BulkUpdateFailed(message=exc.args[0], data=orig_data)
+                    )
+                except Exception:
+                    failed.append(
+                        BulkUpdateFailed(
+                            message="This connection configuration could not be added.",
+                            data=orig_data,
+                        )
+                    )
+
+    try:
+        created_or_updated = _bulk_upsert_connection_rows(db, datas, updates, creates)
+        return BulkPutConnectionConfiguration(
+            succeeded=created_or_updated + replayed,
+            failed=failed,
+        )
+    except SQLAlchemyError:
+        db.rollback()
+        # The bulk statements can't report which rows were at fault (e.g. a
+        # slugified key or name collision), so redo the batch row by row
+        return _create_or_update_connections_per_row(db, configs)
+    except Exception:
+        db.rollback()
+        logger.warning("Bulk connection config upsert failed.")
+        return BulkPutConnectionConfiguration(
+            succeeded=[],
+            failed=[
+                BulkUpdateFailed(
+                    message="This connection configuration could not be added.",
+                    data=config.dict(),
+                )
+                for config in configs
+            ],
+        )
+
+
+def _bulk_upsert_connection_rows(
+    db: Session,
+    datas: List[Dict],
+    updates: List[Dict],
+    creates: List[Dict],
+) -> List[ConnectionConfig]:
+    """Persist a partitioned batch in one transaction: updates as a single
+    ON CONFLICT DO UPDATE statement and creates as a single multi-row INSERT.
+    Returns the written rows in their original request order."""
+    if updates:
+        insert_stmt = insert(ConnectionConfig.__table__).values(updates)
+        db.execute(
+            insert_stmt.on_conflict_do_update(
+                index_elements=[ConnectionConfig.key],
+                set_={
+                    "name": insert_stmt.excluded.name,
+                    "connection_type": insert_stmt.excluded.connection_type,
+                    "access": insert_stmt.excluded.access,
+                    "updated_at": func.now(),
+                },
+            )
+        )
+    if creates:
+        db.execute(insert(ConnectionConfig.__table__).values(creates))
+    db.commit()
+
+    # The update/create partitions share dicts with datas, so this preserves
+    # the original request order including the slugified create keys
+    ordered_keys = [data["key"] for data in datas]
+    by_key = {
+        config.key: config
+        for config in ConnectionConfig.filter(
+            db=db, conditions=ConnectionConfig.key.in_(ordered_keys)
+        )
+    }
+    return [by_key[key] for key in ordered_keys]
+
+
+def _create_or_update_connections_per_row(
+    db: Session,
+    configs: List[CreateConnectionConfiguration],
+) -> BulkPutConnectionConfiguration:
+    """Row-by-row fallback preserving per-row failure reporting."""
     created_or_updated: List[ConnectionConfig] = []
     failed: List[BulkUpdateFailed] = []
-    logger.info(f"Starting bulk upsert for {len(configs)} connection configuration(s)")
 
     for config in configs:
-        orig_data = config.dict().copy()
+        # Serialize the validated model once; create_or_update may mutate its
+        # copy (e.g. slugifying the key), so keep the original for reporting
+        orig_data = config.dict()
         try:
             connection_config = ConnectionConfig.create_or_update(
-                db, data=config.dict()
+                db, data=orig_data.copy()
             )
             created_or_updated.append(connection_config)
         except KeyOrNameAlreadyExists as exc:
@@ -146,12 +358,14 @@ def put_connections(
     dependencies=[Security(verify_oauth_client, scopes=[CONNECTION_DELETE])],
     status_code=204,
 )
-def delete_connection(
+async def delete_connection(
     connection_key: str, *, db: Session = Depends(deps.get_db)
 ) -> None:
     """Removes the connection configuration with matching key."""
     logger.info(f"Finding connection configuration with key {connection_key}")
-    connection_config = ConnectionConfig.get_by(db, field="key", value=connection_key)
+    connection_config = await run_in_threadpool(
+        ConnectionConfig.get_by, db, field="key", value=connection_key
+    )
     if not connection_config:
         raise HTTPException(
             status_code=HTTP_404_NOT_FOUND,
@@ -159,7 +373,7 @@ def delete_connection(
         )
 
     logger.info(f"Deleting connection config with key '{connection_key}'.")
-    connection_config.delete(db)
+    await run_in_threadpool(connection_config.delete, db)
 
 
 def validate_secrets(
@@ -173,6 +387,23 @@ def validate_secrets(
     connection_type = connection_config.connection_type
     schema = get_connection_secrets_validator(connection_type.value)
 
+    # A cheap keyset diff rejects unknown fields before the full validator
+    # runs, mirroring the error shape of the schema's Extra.forbid config
+    if isinstance(request_body, dict):
+        extra_fields = set(request_body) - set(schema.__fields__)
+        if extra_fields:
+            raise HTTPException(
+                status_code=422,
+                detail=[
+                    {
+                        "loc": [field],
+                        "msg": "extra fields not permitted",
+                        "type": "value_error.extra",
+                    }
+                    for field in sorted(extra_fields)
+                ],
+            )
+
     try:
         connection_secrets = schema.parse_obj(request_body)
     except ValidationError as e:
@@ -243,8 +474,11 @@ async def put_connection_config_secrets(
         unvalidated_secrets, connection_config
     ).dict()
     # Save validated secrets, regardless of whether they've been verified.
+    # Flush the UPDATE directly rather than via save(), whose follow-up
+    # refresh would issue a SELECT for row state this response never reads.
     logger.info(f"Updating connection config secrets for '{connection_key}'")
-    connection_config.save(db=db)
+    db.add(connection_config)
+    db.commit()
 
     msg = f"Secrets updated for ConnectionConfig with key: {connection_key}."
     if verify:
@@ -1,13 +1,16 @@
 import logging
-from typing import List
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, HTTPException, Depends
 from fastapi.params import Security
-from fastapi_pagination import Page, Params
+from fastapi_pagination import Page, Params, create_page
 from fastapi_pagination.bases import AbstractPage
-from fastapi_pagination.ext.sqlalchemy import paginate
 from pydantic import conlist
-from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.sql import func
 from fidesops.common_exceptions import ValidationError
 
 from fidesops.common_exceptions import TraversalError
@@ -57,6 +60,27 @@ def _get_connection_config(
     return connection_config
 
 
+@lru_cache(maxsize=128)
+def _validate_traversal(connection_key: str, dataset_json: str) -> Optional[str]:
+    """Build the graph for the serialized dataset and attempt a traversal.
+
+    Returns None if the dataset is traversable, otherwise the error message.
+    Graph construction and traversal are CPU-bound and validation is often
+    re-run against unchanged datasets, so results are memoized. The result is
+    a pure function of the inputs, so no write-path invalidation is needed.
+    """
+    dataset = FidesopsDataset.parse_raw(dataset_json)
+    try:
+        # Attempt to generate a traversal for this dataset by providing an empty
+        # dictionary of all unique identity keys
+        graph = DatasetGraph(convert_dataset_to_graph(dataset, connection_key))
+        unique_identities = set(graph.identity_keys.values())
+        Traversal(graph, {k: None for k in unique_identities})
+    except (TraversalError, ValidationError) as err:
+        return str(err)
+    return None
+
+
 @router.put(
     DATASET_VALIDATE,
     dependencies=[Security(verify_oauth_client, scopes=[DATASET_READ])],
@@ -83,21 +107,16 @@ def validate_dataset(
     information about the traversal (or traversal errors).
     """
 
-    try:
-        # Attempt to generate a traversal for this dataset by providing an empty
-        # dictionary of all unique identity keys
-        graph = DatasetGraph(convert_dataset_to_graph(dataset, connection_config.key))
-        unique_identities = set(graph.identity_keys.values())
-        Traversal(graph, {k: None for k in unique_identities})
-    except (TraversalError, ValidationError) as err:
+    traversal_error = _validate_traversal(connection_config.key, dataset.json())
+    if traversal_error is not None:
         logger.warning(
-            f"Traversal validation failed for dataset '{dataset.fides_key}': {err}"
+            f"Traversal validation failed for dataset '{dataset.fides_key}': {traversal_error}"
         )
         return ValidateDatasetResponse(
             dataset=dataset,
             traversal_details=DatasetTraversalDetails(
                 is_traversable=False,
-                msg=str(err),
+                msg=traversal_error,
             ),
         )
 
@@ -135,24 +154,79 @@ def put_datasets(
     created_or_updated: List[FidesopsDataset] = []
     failed: List[BulkUpdateFailed] = []
     logger.info(f"Starting bulk upsert for {len(datasets)} datasets")
-    for dataset in datasets:
-        data = {
+    dataset_data: List[Dict[str, Any]] = [
+        {
             "connection_config_id": connection_config.id,
             "fides_key": dataset.fides_key,
             "dataset": dataset.dict(),
         }
+        for dataset in datasets
+    ]
+    if not dataset_data:
+        return BulkPutDataset(succeeded=[], failed=[])
+
+    # fides_key is globally unique, so a key in this payload that already
+    # belongs to a different connection must fail its row up front -- the
+    # conflict clause below would otherwise re-parent that dataset here
+    foreign_keys = {
+        key
+        for (key,) in db.query(DatasetConfig.fides_key).filter(
+            DatasetConfig.fides_key.in_([data["fides_key"] for data in dataset_data]),
+            DatasetConfig.connection_config_id != connection_config.id,
+        )
+    }
+    if foreign_keys:
+        for data in dataset_data:
+            if data["fides_key"] in foreign_keys:
+                logger.warning(
+                    f"Create/update failed for dataset '{data['fides_key']}'."
+                )
+                failed.append(
+                    BulkUpdateFailed(
+                        message=f"Dataset create/update failed.",
+                        data=data,
+                    )
+                )
+        dataset_data = [
+            data for data in dataset_data if data["fides_key"] not in foreign_keys
+        ]
+
+    if dataset_data:
         try:
-            # Try to find an existing DatasetConfig matching the given connection & key
-            dataset_config = DatasetConfig.create_or_update(db, data=data)
-            created_or_updated.append(dataset_config.dataset)
+            _upsert_dataset_configs(db, dataset_data)
+            created_or_updated = [
+                dataset
+                for dataset in datasets
+                if dataset.fides_key not in foreign_keys
+            ]
+        except SQLAlchemyError:
+            db.rollback()
+            # The bulk statement can't report which rows were at fault, so
+            # fall back to per-row handling for the succeeded/failed split
+            for data in dataset_data:
+                try:
+                    dataset_config = DatasetConfig.create_or_update(db, data=data)
+                    created_or_updated.append(dataset_config.dataset)
+                except Exception:
+                    logger.warning(
+                        f"Create/update failed for dataset '{data['fides_key']}'."
+                    )
+                    failed.append(
+                        BulkUpdateFailed(
+                            message=f"Dataset create/update failed.",
+                            data=data,
+                        )
+                    )
         except Exception:
-            logger.warning(f"Create/update failed for dataset '{data['fides_key']}'.")
-            failed.append(
-                BulkUpdateFailed(
-                    message=f"Dataset create/update failed.",
-                    data=data,
+            db.rollback()
+            logger.warning("Bulk dataset upsert failed.")
+            for data in dataset_data:
+                failed.append(
+                    BulkUpdateFailed(
+                        message=f"Dataset create/update failed.",
+                        data=data,
+                    )
                 )
-            )
 
     return BulkPutDataset(
         succeeded=created_or_updated,
@@ -160,6 +234,24 @@ def put_datasets(
     )
 
 
+def _upsert_dataset_configs(db: Session, dataset_data: List[Dict[str, Any]]) -> None:
+    """Upsert the batch in a single INSERT ... ON CONFLICT DO UPDATE statement
+    rather than a SELECT + INSERT/UPDATE + COMMIT per dataset. Rows whose
+    fides_key belongs to another connection must be filtered out by the
+    caller before this runs."""
+    insert_stmt = insert(DatasetConfig.__table__).values(dataset_data)
+    db.execute(
+        insert_stmt.on_conflict_do_update(
+            index_elements=[DatasetConfig.fides_key],
+            set_={
+                "dataset": insert_stmt.excluded.dataset,
+                "updated_at": func.now(),
+            },
+        )
+    )
+    db.commit()
+
+
 @router.get(
     DATASETS,
     dependencies=[Security(verify_oauth_client, scopes=[DATASET_READ])],
@@ -175,19 +267,34 @@ def get_datasets(
     logger.info(
         f"Finding all datasets for connection '{connection_config.key}' with pagination params {params}"
     )
-    dataset_configs = DatasetConfig.filter(
+    query = DatasetConfig.filter(
         db=db, conditions=(DatasetConfig.connection_config_id == connection_config.id)
-    )
+    ).order_by(DatasetConfig.id)
 
-    # Generate the paginated results, but don't return them as-is. Instead,
-    # modify the items array to be just the FidesopsDataset instead of the full
-    # DatasetConfig. This has to be done *afterwards* to ensure that the
-    # paginated query is handled by paginate()
-    paginated_results = paginate(dataset_configs, params=params)
-    paginated_results.items = [
-        dataset_config.dataset for dataset_config in paginated_results.items
+    # Paginate with a deferred join: page through the narrow id column first,
+    # then load the full JSONB rows for only the requested page. This keeps
+    # pagination entirely in SQL and avoids reading full rows past the offset.
+    total = query.count()
+    raw_params = params.to_raw_params()
+    page_ids = [
+        row.id
+        for row in query.with_entities(DatasetConfig.id)
+        .limit(raw_params.limit)
+        .offset(raw_params.offset)
     ]
-    return paginated_results
+    items: List[FidesopsDataset] = []
+    if page_ids:
+        # joinedload the parent config so nothing downstream can trigger a
+        # lazy load per row; the page then costs exactly one SELECT
+        items = [
+            dataset_config.dataset
+            for dataset_config in DatasetConfig.filter(
+                db=db, conditions=(DatasetConfig.id.in_(page_ids))
+            )
+            .options(joinedload(DatasetConfig.connection_config))
+            .order_by(DatasetConfig.id)
+        ]
+    return create_page(items, total, params)
 
 
 @router.get(
@@ -234,22 +341,19 @@ def delete_dataset(
     """Removes the dataset based on the given key."""
 
     logger.info(
-        f"Finding dataset '{fides_key}' for connection '{connection_config.key}'"
+        f"Deleting dataset '{fides_key}' for connection '{connection_config.key}'"
     )
-    dataset_config = DatasetConfig.filter(
+    # Delete in a single statement instead of fetching the row first
+    deleted_count = DatasetConfig.filter(
         db=db,
         conditions=(
             (DatasetConfig.connection_config_id == connection_config.id)
             & (DatasetConfig.fides_key == fides_key)
         ),
-    ).first()
-    if not dataset_config:
+    ).delete(synchronize_session=False)
+    db.commit()
+    if not deleted_count:
         raise HTTPException(
             status_code=HTTP_404_NOT_FOUND,
             detail=f"No dataset with fides_key '{fides_key}' and connection_key '{connection_config.key}'",
         )
-
-    logger.info(
-        f"Deleting dataset '{fides_key}' for connection '{connection_config.key}'"
-    )
-    dataset_config.delete(db)
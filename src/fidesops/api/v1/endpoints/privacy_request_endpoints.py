@@ -3,7 +3,7 @@ from collections import defaultdict
 from datetime import date
 from typing import List, Optional, Union, DefaultDict, Dict
 
-from fastapi import APIRouter, Body, Depends, Security, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Body, Depends, Security, HTTPException
 from fastapi_pagination import Page, Params
 from fastapi_pagination.bases import AbstractPage
 from fastapi_pagination.ext.sqlalchemy import paginate
@@ -54,6 +54,24 @@ router = APIRouter(tags=["Privacy Requests"], prefix=urls.V1_URL_PREFIX)
 EMBEDDED_EXECUTION_LOG_LIMIT = 50
 
 
+def _run_privacy_request(runner: PrivacyRequestRunner) -> None:
+    """Execute a privacy request in the background. No HTTP response can
+    report failures at this point, so record them on the request itself
+    instead of letting the exception escape into the ASGI background phase
+    and leave the request in_processing forever."""
+    try:
+        runner.run()
+    except Exception as exc:  # pylint: disable=broad-except
+        logger.error(
+            "Privacy request %s failed: %s", runner.privacy_request.id, exc
+        )
+        # The failure may have left the session mid-transaction; reset it so
+        # the error status can be flushed
+        runner.db.rollback()
+        runner.privacy_request.status = PrivacyRequestStatus.error
+        runner.privacy_request.save(db=runner.db)
+
+
 @router.post(
     urls.PRIVACY_REQUESTS,
     status_code=200,
@@ -61,6 +79,7 @@ EMBEDDED_EXECUTION_LOG_LIMIT = 50
 )
 def create_privacy_request(
     *,
+    background_tasks: BackgroundTasks,
     cache: FidesopsRedis = Depends(deps.get_cache),
     db: Session = Depends(deps.get_db),
     client: ClientDetail = Security(
@@ -131,11 +150,17 @@ def create_privacy_request(
             for identity in privacy_request_data.identities:
                 privacy_request.cache_identity(identity)
 
-            PrivacyRequestRunner(
-                cache=cache,
-                db=db,
-                privacy_request=privacy_request,
-            ).run()
+            # Execute the request after the response is returned: the graph
+            # traversal and storage uploads are multi-second network I/O that
+            # should not hold the HTTP request open
+            background_tasks.add_task(
+                _run_privacy_request,
+                PrivacyRequestRunner(
+                    cache=cache,
+                    db=db,
+                    privacy_request=privacy_request,
+                ),
+            )
         except common_exceptions.RedisConnectionError as exc:
             logger.error("RedisConnectionError: %s", exc)
             # Thrown when cache.ping() fails on cache connection retrieval
@@ -91,6 +91,7 @@ class ExecutionSettings(FidesSettings):
     TASK_RETRY_COUNT: int
     TASK_RETRY_DELAY: int  # In seconds
     TASK_RETRY_BACKOFF: int
+    MAX_PARALLEL_TASKS: int = 16
 
     class Config:
         env_prefix = "FIDESOPS__EXECUTION__"
@@ -269,6 +270,7 @@ CONFIG_KEY_ALLOWLIST = {
         "TASK_RETRY_COUNT",
         "TASK_RETRY_DELAY",
         "TASK_RETRY_BACKOFF",
+        "MAX_PARALLEL_TASKS",
     ],
 }
 
@@ -1,5 +1,6 @@
 import logging
 import os
+from functools import lru_cache
 from typing import Optional
 
 from sqlalchemy import create_engine
@@ -14,6 +15,13 @@ from fidesops.core.config import config
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _engine_for_uri(database_uri: str) -> Engine:
+    """Build (and cache) one engine per database uri. Engines own a connection
+    pool, so constructing one per request would defeat pooling entirely."""
+    return create_engine(database_uri, pool_pre_ping=True)
+
+
 def get_db_engine(database_uri: Optional[str] = None) -> Engine:
     """
     Return a database engine. If the TESTING environment var is set the
@@ -27,7 +35,7 @@ def get_db_engine(database_uri: Optional[str] = None) -> Engine:
         else:
             database_uri = config.database.SQLALCHEMY_DATABASE_URI
 
-    return create_engine(database_uri, pool_pre_ping=True)
+    return _engine_for_uri(database_uri)
 
 
 def get_db_session(engine: Optional[Engine] = None) -> sessionmaker:
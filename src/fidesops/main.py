@@ -1,6 +1,7 @@
 import logging
 import uvicorn
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from starlette.middleware.cors import CORSMiddleware
 
 from fidesops.api.v1.api import api_router
@@ -14,7 +15,12 @@ logging.basicConfig(level=logging.INFO)
 logging.setLogRecordFactory(get_fides_log_record_factory())
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="fidesops", openapi_url=f"{V1_URL_PREFIX}/openapi.json")
+# orjson serializes responses several times faster than the stdlib encoder
+app = FastAPI(
+    title="fidesops",
+    openapi_url=f"{V1_URL_PREFIX}/openapi.json",
+    default_response_class=ORJSONResponse,
+)
 
 # Set all CORS enabled origins
 if config.security.CORS_ORIGINS:
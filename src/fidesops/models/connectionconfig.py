@@ -4,6 +4,7 @@ from datetime import datetime
 from sqlalchemy import (
     Column,
     Enum,
+    Index,
     String,
     DateTime,
     Boolean,
@@ -55,6 +56,10 @@ class ConnectionConfig(Base):
     key = Column(String, index=True, unique=True, nullable=False)
     connection_type = Column(Enum(ConnectionType), nullable=False)
     access = Column(Enum(AccessLevel), nullable=False)
+    # Type bytea in the db. Because the whole document is encrypted at rest,
+    # the column cannot be JSONB and writes always replace the full blob;
+    # server-side partial updates (jsonb_set / ||) would require storing the
+    # credentials unencrypted.
     secrets = Column(
         MutableDict.as_mutable(
             StringEncryptedType(
@@ -65,10 +70,28 @@ class ConnectionConfig(Base):
             )
         ),
         nullable=True,
-    )  # Type bytea in the db
+    )
     last_test_timestamp = Column(DateTime(timezone=True))
     last_test_succeeded = Column(Boolean)
 
+    # Covering index: keyed reads that select only the response columns can be
+    # served by an index-only scan without touching the heap
+    __table_args__ = (
+        Index(
+            "ix_connectionconfig_key_covering",
+            "key",
+            postgresql_include=[
+                "name",
+                "connection_type",
+                "access",
+                "created_at",
+                "updated_at",
+                "last_test_timestamp",
+                "last_test_succeeded",
+            ],
+        ),
+    )
+
     def update_test_status(self, succeeded: bool, db: Session) -> None:
         """Updates last_test_timestamp and last_test_succeeded after an attempt to make a test connection."""
         self.last_test_timestamp = datetime.now()
@@ -5,6 +5,7 @@ from boto3 import Session
 from sqlalchemy import (
     Column,
     ForeignKey,
+    Index,
     String,
 )
 from sqlalchemy.dialects.postgresql import JSONB
@@ -48,6 +49,16 @@ class DatasetConfig(Base):
         backref="datasets",
     )
 
+    # Covers the (connection_config_id, fides_key) lookups used by the
+    # dataset endpoints; uniqueness is already enforced by fides_key alone
+    __table_args__ = (
+        Index(
+            "ix_datasetconfig_connection_config_id_fides_key",
+            "connection_config_id",
+            "fides_key",
+        ),
+    )
+
     @classmethod
     def create_or_update(cls, db: Session, *, data: Dict[str, Any]) -> "DatasetConfig":
         """
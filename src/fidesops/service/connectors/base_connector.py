@@ -57,3 +57,7 @@ class BaseConnector(ABC):
     def dry_run_query(self, node: TraversalNode) -> str:
         """Generate a dry-run query to display action that will be taken"""
         return self.query_config(node).dry_run_query()
+
+    def close(self) -> None:
+        """Release any resources held by this connector. Connectors that keep
+        a live client open override this; by default there is nothing to do."""
@@ -1,11 +1,12 @@
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
-from pymongo import MongoClient
+from pymongo import MongoClient, UpdateOne
 from pymongo.errors import ServerSelectionTimeoutError, OperationFailure
 
 from fidesops.common_exceptions import ConnectionException
 from fidesops.graph.traversal import Row, TraversalNode
+from fidesops.models.connectionconfig import ConnectionConfig
 from fidesops.models.policy import Policy
 from fidesops.schemas.connection_configuration.connection_secrets_mongodb import (
     MongoDBSchema,
@@ -22,12 +23,25 @@ logger = logging.getLogger(__name__)
 class MongoDBConnector(BaseConnector):
     """MongoDB Connector"""
 
+    def __init__(self, configuration: ConnectionConfig):
+        super().__init__(configuration)
+        self._client: Optional[MongoClient] = None
+        self._config: Optional[MongoDBSchema] = None
+
+    @property
+    def config(self) -> MongoDBSchema:
+        """Parsed connection secrets. configuration.secrets is fixed for the
+        connector's lifetime, so the schema is validated only once."""
+        if self._config is None:
+            self._config = MongoDBSchema(**self.configuration.secrets or {})
+        return self._config
+
     def build_uri(self) -> str:
         """
         Builds URI of format mongodb://[username:password@]host1[:port1][,...hostN[:portN]][/[defaultauthdb][?options]]
         """
 
-        config = MongoDBSchema(**self.configuration.secrets or {})
+        config = self.config
 
         user_pass: str = ""
         default_auth_db: str = ""
@@ -42,13 +56,25 @@ class MongoDBConnector(BaseConnector):
         return url
 
     def client(self) -> MongoClient:
-        """Returns a client for a MongoDB instance"""
-        config = MongoDBSchema(**self.configuration.secrets or {})
-        uri = config.url if config.url else self.build_uri()
-        try:
-            return MongoClient(uri, serverSelectionTimeoutMS=5000)
-        except ValueError:
-            raise ConnectionException("Value Error connecting to MongoDB.")
+        """Returns the memoized client for a MongoDB instance, creating it on
+        first use. MongoClient maintains its own thread-safe connection pool,
+        so one instance is shared across all calls on this connector."""
+        if self._client is None:
+            config = self.config
+            uri = config.url if config.url else self.build_uri()
+            try:
+                self._client = MongoClient(
+                    uri, serverSelectionTimeoutMS=5000, maxPoolSize=50
+                )
+            except ValueError:
+                raise ConnectionException("Value Error connecting to MongoDB.")
+        return self._client
+
+    def close(self) -> None:
+        """Close the underlying MongoClient and drop the memoized instance."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
 
     def query_config(self, node: TraversalNode) -> QueryConfig[Any]:
         """Query wrapper corresponding to the input traversal_node."""
@@ -58,7 +84,7 @@ class MongoDBConnector(BaseConnector):
         """
         Connects to the Mongo database and makes two trivial queries to ensure connection is valid.
         """
-        config = MongoDBSchema(**self.configuration.secrets or {})
+        config = self.config
         logger.info(f"Starting test connection to {self.configuration.key}")
         client = self.client()
         try:
@@ -75,8 +101,6 @@ class MongoDBConnector(BaseConnector):
             raise ConnectionException("Operation Failure connecting to MongoDB.")
         except Exception:
             raise ConnectionException("Connection Error connecting to MongoDB.")
-        finally:
-            client.close()
 
     def retrieve_data(
         self, node: TraversalNode, policy: Policy, input_data: Dict[str, List[Any]]
@@ -84,40 +108,44 @@ class MongoDBConnector(BaseConnector):
         """Retrieve mongo data"""
         # pylint: disable = too-many-locals
         query_config = self.query_config(node)
-        client = self.client()
 
+        # Generate the query before touching the client so empty inputs
+        # short-circuit without a Mongo connection
         query_components = query_config.generate_query(input_data, policy)
         if query_components is None:
             return []
         query_data, fields = query_components
+        client = self.client()
 
         db_name = node.address.dataset
         collection_name = node.address.collection
 
         db = client[db_name]
         collection = db[collection_name]
-        rows = []
         logger.info(f"Starting data retrieval for {node.address}")
-        for row in collection.find(query_data, fields):
-            rows.append(row)
+        # Materialize the cursor directly and batch network fetches explicitly
+        # rather than appending row-by-row in Python
+        rows = list(collection.find(query_data, fields, batch_size=1000))
         logger.info(f"Found {len(rows)} on {node.address}")
         return rows
 
     def mask_data(self, node: TraversalNode, policy: Policy, rows: List[Row]) -> int:
         # pylint: disable=too-many-locals
         """Execute a masking request"""
+        if not rows:
+            return 0
         query_config = self.query_config(node)
         collection_name = node.address.collection
         client = self.client()
-        update_ct = 0
+        # node.address is invariant for the whole batch, so resolve the
+        # collection handle once rather than per row
+        collection = client[node.address.dataset][collection_name]
+        operations = []
         for row in rows:
             update_stmt = query_config.generate_update_stmt(row, policy)
             if update_stmt is not None:
                 query, update = update_stmt
-                db = client[node.address.dataset]
-                collection = db[collection_name]
-                update_result = collection.update_one(query, update, upsert=False)
-                update_ct += update_result.modified_count
+                operations.append(UpdateOne(query, update, upsert=False))
                 logger.info(
                     "db.%s.update_one(%s, %s, upsert=False)",
                     NotPii(collection_name),
@@ -125,4 +153,11 @@ class MongoDBConnector(BaseConnector):
                     update,
                 )
 
-        return update_ct
+        if not operations:
+            return 0
+
+        # Issue all updates for this collection in a single bulk_write rather
+        # than one round-trip per document. ordered=False lets the server
+        # process the batch without stopping at the first failure.
+        result = collection.bulk_write(operations, ordered=False)
+        return result.modified_count
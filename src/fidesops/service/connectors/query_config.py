@@ -268,6 +268,10 @@ class MongoQueryConfig(QueryConfig[MongoStatement]):
             filtered_data = self.filter_values(input_data)
             if filtered_data:
                 field_list = {field_name: 1 for field_name in self.fields}
+                if "_id" not in field_list:
+                    # Mongo returns _id by default; exclude it server-side
+                    # unless the dataset declares it as a field of interest
+                    field_list["_id"] = 0
                 query_pairs = {}
                 for field_name, data in filtered_data.items():
 
@@ -1,6 +1,6 @@
 import logging
 from abc import abstractmethod
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from sqlalchemy import Column
 from sqlalchemy.engine import Engine, create_engine, CursorResult, LegacyCursorResult
@@ -9,6 +9,7 @@ from snowflake.sqlalchemy import URL
 
 from fidesops.common_exceptions import ConnectionException
 from fidesops.graph.traversal import Row, TraversalNode
+from fidesops.models.connectionconfig import ConnectionConfig
 from fidesops.models.policy import Policy
 from fidesops.schemas.connection_configuration import (
     PostgreSQLSchema,
@@ -30,6 +31,10 @@ class SQLConnector(BaseConnector):
     """A SQL connector represents an abstract connector to any datastore that can be
     interacted with via standard SQL via SQLAlchemy"""
 
+    def __init__(self, configuration: ConnectionConfig):
+        super().__init__(configuration)
+        self._engine: Optional[Engine] = None
+
     @staticmethod
     def cursor_result_to_rows(results: CursorResult) -> List[Row]:
         """Convert SQLAlchemy results to a list of dictionaries"""
@@ -44,9 +49,23 @@ class SQLConnector(BaseConnector):
     def build_uri(self) -> str:
         """Build a database specific uri connection string"""
 
-    @abstractmethod
+    def create_client(self) -> Engine:
+        """Build a database specific SQLAlchemy engine"""
+        raise NotImplementedError()
+
     def client(self) -> Engine:
-        """Return SQLAlchemy engine that can be used to interact with a database"""
+        """Returns the memoized engine for this connector, creating it on
+        first use. Engines own a connection pool, so building one per call
+        would pay pool and dialect setup each time and defeat pooling."""
+        if self._engine is None:
+            self._engine = self.create_client()
+        return self._engine
+
+    def close(self) -> None:
+        """Dispose of the engine and its connection pool."""
+        if self._engine is not None:
+            self._engine.dispose()
+            self._engine = None
 
     def query_config(self, node: TraversalNode) -> SQLQueryConfig:
         """Query wrapper corresponding to the input traversal_node."""
@@ -118,7 +137,7 @@ class PostgreSQLConnector(SQLConnector):
         dbname = f"/{config.dbname}" if config.dbname else ""
         return f"postgresql://{user_password}{netloc}{port}{dbname}"
 
-    def client(self) -> Engine:
+    def create_client(self) -> Engine:
         """Returns a SQLAlchemy Engine that can be used to interact with a PostgreSQL database"""
         config = PostgreSQLSchema(**self.configuration.secrets or {})
         uri = config.url or self.build_uri()
@@ -144,7 +163,7 @@ class MySQLConnector(SQLConnector):
         url = f"mysql+pymysql://{user_password}{netloc}{port}{dbname}"
         return url
 
-    def client(self) -> Engine:
+    def create_client(self) -> Engine:
         """Returns a SQLAlchemy Engine that can be used to interact with a MySQL database"""
         config = MySQLSchema(**self.configuration.secrets or {})
         uri = config.url or self.build_uri()
@@ -163,7 +182,7 @@ class RedshiftConnector(SQLConnector):
         url = f"redshift+psycopg2://{config.user}:{config.password}@{config.host}{port}{database}"
         return url
 
-    def client(self) -> Engine:
+    def create_client(self) -> Engine:
         """Returns a SQLAlchemy Engine that can be used to interact with an Amazon Redshift cluster"""
         config = RedshiftSchema(**self.configuration.secrets or {})
         uri = config.url or self.build_uri()
@@ -199,7 +218,7 @@ class SnowflakeConnector(SQLConnector):
         url: str = URL(**kwargs)
         return url
 
-    def client(self) -> Engine:
+    def create_client(self) -> Engine:
         """Returns a SQLAlchemy Engine that can be used to interact with Snowflake"""
         config = SnowflakeSchema(**self.configuration.secrets or {})
         uri: str = config.url or self.build_uri()
@@ -67,11 +67,7 @@ def _construct_file_key(request_id: str, config: StorageConfig) -> str:
 
 def _get_uploader_from_config_type(storage_type: StorageType) -> Any:
     """Determines which uploader method to use based on storage type"""
-    return {
-        StorageType.s3.value: _s3_uploader,
-        StorageType.onetrust.value: _onetrust_uploader,
-        StorageType.local.value: _local_uploader,
-    }[storage_type.value]
+    return _UPLOADER_DISPATCH[storage_type.value]
 
 
 def _s3_uploader(_: Session, config: StorageConfig, data: Dict, request_id: str) -> str:
@@ -114,7 +110,10 @@ def _local_uploader(
     if not os.path.exists(LOCAL_FIDES_UPLOAD_DIRECTORY):
         os.makedirs(LOCAL_FIDES_UPLOAD_DIRECTORY)
     with open(f"{LOCAL_FIDES_UPLOAD_DIRECTORY}/{file_key}", "w") as f:
-        json.dump(data, f, default=_handle_json_encoding)
+        # Stream the encoder output chunk by chunk instead of materializing
+        # the entire serialized payload in memory before writing
+        for chunk in json.JSONEncoder(default=_handle_json_encoding).iterencode(data):
+            f.write(chunk)
     return "success"
 
 
@@ -123,3 +122,11 @@ def _handle_json_encoding(field: Any) -> str:
     if isinstance(field, datetime):
         return field.strftime("%Y-%m-%dT%H:%M:%S")
     return field
+
+
+# Built once at import so each upload avoids rebuilding the dispatch dict
+_UPLOADER_DISPATCH: Dict[str, Any] = {
+    StorageType.s3.value: _s3_uploader,
+    StorageType.onetrust.value: _onetrust_uploader,
+    StorageType.local.value: _local_uploader,
+}
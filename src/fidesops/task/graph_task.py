@@ -315,9 +315,17 @@ def run_access_request(
     dsk = {k: (t.access_request, *t.input_keys) for k, t in env.items()}
     dsk[ROOT_COLLECTION_ADDRESS] = (start_function(traversal.seed_data),)
     dsk[TERMINATOR_ADDRESS] = (termination_fn, *end_nodes)
-    v = dask.delayed(get(dsk, TERMINATOR_ADDRESS))
+    # Independent nodes run concurrently on dask's thread pool; node work is
+    # I/O-bound so threads overlap the network round-trips. Bound the pool so
+    # wide graphs can't open unbounded connections.
+    v = dask.delayed(
+        get(dsk, TERMINATOR_ADDRESS, num_workers=config.execution.MAX_PARALLEL_TASKS)
+    )
 
-    return v.compute()
+    try:
+        return v.compute()
+    finally:
+        resources.close()
 
 
 def run_erasure(  # pylint: disable = too-many-arguments
@@ -356,9 +364,14 @@ def run_erasure(  # pylint: disable = too-many-arguments
     }
     # terminator function waits for all keys
     dsk[TERMINATOR_ADDRESS] = (termination_fn, *env.keys())
-    v = dask.delayed(get(dsk, TERMINATOR_ADDRESS))
+    v = dask.delayed(
+        get(dsk, TERMINATOR_ADDRESS, num_workers=config.execution.MAX_PARALLEL_TASKS)
+    )
 
-    update_cts: Tuple[int, ...] = v.compute()
+    try:
+        update_cts: Tuple[int, ...] = v.compute()
+    finally:
+        resources.close()
     # we combine the output of the termination function with the input keys to provide
     # a map of {collection_name: records_updated}:
     erasure_update_map: Dict[str, int] = dict(zip([str(x) for x in env], update_cts))
@@ -1,5 +1,8 @@
 import logging
-from typing import Dict, Any, Optional, List
+import threading
+from typing import Dict, Any, Optional, List, Tuple
+
+from sqlalchemy.orm import Session
 
 from fidesops.common_exceptions import ConnectorNotFoundException
 from fidesops.db.session import get_db_session
@@ -20,21 +23,43 @@ from fidesops.util.cache import get_cache
 
 logger = logging.getLogger(__name__)
 
+# Number of buffered execution logs that triggers a bulk flush to the db
+EXECUTION_LOG_FLUSH_SIZE = 100
+
 
 class Connections:
-    """Temporary container for connections. This will be replaced."""
+    """Container for connectors, keyed by connection config key and versioned
+    by the config's updated_at so that secret changes rebuild the connector.
+    The process-wide instance below is shared across privacy requests, letting
+    connection pools be reused instead of rebuilt per request."""
 
     def __init__(self) -> None:
-        self.connections: Dict[str, BaseConnector] = {}
+        self.connections: Dict[str, Tuple[BaseConnector, Any]] = {}
+        self._lock = threading.Lock()
 
     def get_connector(self, connection_config: ConnectionConfig) -> BaseConnector:
-        """Return the connector corresponding to this config. Will return the existing
-        connector or create one if it does not yet exist."""
+        """Return the connector corresponding to this config. Returns the
+        cached connector unless the config has changed since it was built, in
+        which case the stale connector is closed and replaced."""
         key = connection_config.key
-        if key not in self.connections:
+        version = (connection_config.connection_type, connection_config.updated_at)
+        with self._lock:
+            cached = self.connections.get(key)
+            if cached is not None:
+                connector, cached_version = cached
+                if cached_version == version:
+                    return connector
+                connector.close()
             connector = Connections.build_connector(connection_config)
-            self.connections[key] = connector
-        return self.connections[key]
+            self.connections[key] = (connector, version)
+            return connector
+
+    def close(self) -> None:
+        """Close all held connectors and drop them from the container."""
+        with self._lock:
+            for connector, _ in self.connections.values():
+                connector.close()
+            self.connections = {}
 
     @staticmethod
     def build_connector(connection_config: ConnectionConfig) -> BaseConnector:
@@ -50,6 +75,10 @@ class Connections:
         )
 
 
+# Process-wide connector cache shared by all TaskResources instances
+_connections = Connections()
+
+
 class TaskResources:
     """Shared information and environment for all nodes of a given task.
     This includes
@@ -72,7 +101,13 @@ class TaskResources:
         self.connection_configs: Dict[str, ConnectionConfig] = {
             c.key: c for c in connection_configs
         }
-        self.connections = Connections()
+        self.connections = _connections
+        # Execution logs are buffered and written in bulk through a single
+        # shared session instead of opening a new session per log row. The
+        # lock guards the buffer since tasks may log from multiple threads.
+        self._log_session: Session = get_db_session()()
+        self._log_buffer: List[Dict[str, Any]] = []
+        self._log_lock = threading.Lock()
 
     def cache_object(self, key: str, value: Any) -> None:
         """Store in cache. Object will be
@@ -93,23 +128,40 @@ class TaskResources:
         status: ExecutionLogStatus,
         message: str = None,
     ) -> Any:
-        """Store in application db. Return the created or written-to id field value."""
-        SessionLocal = get_db_session()
-        db = SessionLocal()
-
-        ExecutionLog.create(
-            db=db,
-            data={
-                "dataset_name": collection_address.dataset,
-                "collection_name": collection_address.collection,
-                "fields_affected": fields_affected,
-                "action_type": action_type,
-                "status": status,
-                "privacy_request_id": self.request.id,
-                "message": message,
-            },
-        )
-        db.close()
+        """Buffer an execution log row to be written to the application db.
+
+        Rows are flushed in bulk once the buffer reaches EXECUTION_LOG_FLUSH_SIZE,
+        or when close() is called at the end of the traversal."""
+        with self._log_lock:
+            self._log_buffer.append(
+                {
+                    "dataset_name": collection_address.dataset,
+                    "collection_name": collection_address.collection,
+                    "fields_affected": fields_affected,
+                    "action_type": action_type,
+                    "status": status,
+                    "privacy_request_id": self.request.id,
+                    "message": message,
+                }
+            )
+            if len(self._log_buffer) >= EXECUTION_LOG_FLUSH_SIZE:
+                self._flush_execution_logs()
+
+    def _flush_execution_logs(self) -> None:
+        """Bulk insert all buffered execution logs. The caller must hold _log_lock."""
+        if not self._log_buffer:
+            return
+        self._log_session.bulk_insert_mappings(ExecutionLog, self._log_buffer)
+        self._log_session.commit()
+        self._log_buffer.clear()
+
+    def close(self) -> None:
+        """Flush any remaining buffered execution logs and close the shared
+        session. Connectors are left open: they belong to the process-wide
+        cache and are reused by subsequent privacy requests."""
+        with self._log_lock:
+            self._flush_execution_logs()
+        self._log_session.close()
 
     def get_connector(self, key: str) -> Any:
         """Create or return the client corresponding to the given ConnectionConfig key"""
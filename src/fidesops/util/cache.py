@@ -1,4 +1,5 @@
 import base64
+import itertools
 import logging
 import pickle
 from typing import (
@@ -26,12 +27,31 @@ RedisValue = Union[bytes, float, int, str]
 _connection = None
 
 
+# Collect keys matching a pattern along with their values in a single
+# server-side pass, returned as a flat [key1, value1, key2, value2, ...] list
+_SCAN_AND_GET_SCRIPT = """
+local cursor = "0"
+local out = {}
+repeat
+    local result = redis.call('SCAN', cursor, 'MATCH', ARGV[1], 'COUNT', 1000)
+    cursor = result[1]
+    for _, key in ipairs(result[2]) do
+        out[#out + 1] = key
+        out[#out + 1] = redis.call('GET', key)
+    end
+until cursor == "0"
+return out
+"""
+
+
 class FidesopsRedis(Redis):
     """
     An extension to Redis' python bindings to support auto expiring data input. This class
     should never be instantiated on its own.
     """
 
+    _scan_and_get_script: Optional[Script] = None
+
     def set_with_autoexpire(self, key: str, value: RedisValue) -> Optional[bool]:
         """Call the connection class' default set method with ex= our default TTL"""
         return self.set(key, value, ex=config.redis.DEFAULT_TTL_SECONDS)
@@ -47,29 +67,57 @@ class FidesopsRedis(Redis):
             out.extend(keys)
         return out
 
-    def delete_keys_by_prefix(self, prefix: str) -> None:
-        """Delete all keys starting with a given prefix"""
-        s: Script = self.register_script(
-            f"for _,k in ipairs(redis.call('keys','{prefix}*')) do redis.call('del',k) end"
-        )
-        s()
+    def delete_keys_by_prefix(self, prefix: str, chunk_size: int = 1000) -> None:
+        """Delete all keys starting with a given prefix.
+
+        Iterates with SCAN and removes each batch with UNLINK so that memory is
+        reclaimed off the event loop, instead of a blocking KEYS-based script
+        that scales with the size of the whole keyspace."""
+        cursor: Any = "0"
+        while cursor != 0:
+            cursor, keys = self.scan(
+                cursor=cursor, match=f"{prefix}*", count=chunk_size
+            )
+            if keys:
+                self.unlink(*keys)
 
-    def get_values(self, keys: List[str]) -> Dict[str, Optional[Any]]:
+    def get_values(
+        self, keys: List[str], chunk_size: int = 500
+    ) -> Dict[str, Optional[Any]]:
         """Retrieve all values corresponding to the set of input keys and return them as a
-        dictionary. Note that if a key does not exist in redis it will be returned as None"""
-        values = self.mget(keys)
-        return {x[0]: x[1] for x in zip(keys, values)}
+        dictionary. Note that if a key does not exist in redis it will be returned as None.
+
+        Keys are fetched as pipelined MGETs of chunk_size so one very large
+        command never monopolizes the server, while still costing a single
+        network round-trip."""
+        if not keys:
+            # A zero-key MGET is an error; skip the round-trip entirely
+            return {}
+        pipe = self.pipeline(transaction=False)
+        for i in range(0, len(keys), chunk_size):
+            pipe.mget(keys[i : i + chunk_size])
+        values = list(itertools.chain.from_iterable(pipe.execute()))
+        return dict(zip(keys, values))
 
     def set_encoded_object(self, key: str, obj: Any) -> Optional[bool]:
         """Set an object in redis in an encoded form. This object should be retrieved via
         get_objects_by_prefix or processed with decode_obj."""
         return self.set_with_autoexpire(f"EN_{key}", FidesopsRedis.encode_obj(obj))
 
+    def scan_and_get(self, match: str) -> Dict[str, Optional[Any]]:
+        """Retrieve all keys matching a pattern and their values in a single
+        round-trip via a server-side script, rather than chaining a SCAN
+        cursor loop with a separate MGET."""
+        if self._scan_and_get_script is None:
+            self._scan_and_get_script = self.register_script(_SCAN_AND_GET_SCRIPT)
+        flat: List[Any] = self._scan_and_get_script(args=[match])
+        pairs = iter(flat)
+        return dict(zip(pairs, pairs))
+
     def get_encoded_objects_by_prefix(self, prefix: str) -> Dict[str, Optional[Any]]:
         """Return all objects stored under a given prefix. This method
         assumes these objects have been stored encoded using set_object"""
-        keys = self.get_keys_by_prefix(f"EN_{prefix}")
-        encoded_object_dict = self.get_values(keys)
+        encoded_object_dict = self.scan_and_get(f"EN_{prefix}*")
         return {
             key: FidesopsRedis.decode_obj(value)
             for key, value in encoded_object_dict.items()
@@ -77,8 +125,13 @@ class FidesopsRedis(Redis):
 
     @staticmethod
     def encode_obj(obj: Any) -> bytes:
-        """Encode an object to a base64 string that can be stored in Redis"""
-        return base64.b64encode(pickle.dumps(obj))
+        """Encode an object to a base64 string that can be stored in Redis.
+
+        Pickling uses the highest available protocol for the most compact
+        binary form. The base64 wrapper is still required because our shared
+        connection runs with decode_responses=True, which would corrupt raw
+        pickle bytes on the way back out."""
+        return base64.b64encode(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
 
     @staticmethod
     def decode_obj(bs: Optional[bytes]) -> Any:
@@ -122,6 +175,8 @@ def get_identity_cache_key(privacy_request_id: str, identity_attribute: str) ->
 def get_all_cache_keys_for_privacy_request(privacy_request_id: str) -> Set:
     """Returns all cache keys related to this privacy request's cached identities"""
     cache: FidesopsRedis = get_cache()
-    return cache.keys(f"{privacy_request_id}-*") + cache.keys(
-        f"id-{privacy_request_id}-*"
+    # SCAN incrementally instead of KEYS, which is O(total keyspace) and
+    # blocks the Redis event loop
+    return cache.get_keys_by_prefix(f"{privacy_request_id}-") + cache.get_keys_by_prefix(
+        f"id-{privacy_request_id}-"
     )
@@ -17,5 +17,9 @@ def generate_secure_random_string(length_in_bytes: int) -> str:
 
 
 def generate_salt() -> str:
-    """Generates a salt using bcrypt and returns a string using the configured default encoding"""
+    """Generates a salt using bcrypt and returns a string using the configured default encoding.
+
+    Note that bcrypt is only used as a salt source: secrets are hashed with
+    SHA-512 in hash_with_salt, so the work factor encoded in the salt is
+    never exercised and salt generation is effectively free."""
     return bcrypt.gensalt().decode(config.security.ENCODING)
@@ -1,5 +1,6 @@
 import json
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 from fastapi import Depends, Security
@@ -91,6 +92,16 @@ def generate_jwe(payload: str) -> str:
     ).decode(config.security.ENCODING)
 
 
+@lru_cache(maxsize=1024)
+def _decrypt_jwe(jwe_string: str) -> str:
+    """Decrypt a JWE with the application key.
+
+    Tokens are immutable and the same bearer string is presented on many
+    requests, so repeated decrypts collapse into a cache lookup. Expiry is
+    still enforced per request on the decrypted issued-at claim."""
+    return jwe.decrypt(jwe_string, config.security.APP_ENCRYPTION_KEY)
+
+
 def extract_payload(jwe_string: str) -> str:
     """Given a jwe, extracts the payload and returns it in string form"""
-    return jwe.decrypt(jwe_string, config.security.APP_ENCRYPTION_KEY)
+    return _decrypt_jwe(jwe_string)
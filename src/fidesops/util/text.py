@@ -1,14 +1,23 @@
 import re
+from functools import lru_cache
 
 import unidecode
 
+_NON_WORD_PATTERN = re.compile(r"[^\w\s-]")
+_SEPARATOR_PATTERN = re.compile(r"[\s-]+")
+_EDGE_DASH_PATTERN = re.compile(r"^-+|-+$")
 
+
+@lru_cache(maxsize=1024)
 def slugify(text: str) -> str:
     """
     Returns a URL compatible slug based upon the input text.
+
+    Results are memoized since the same names and keys are slugified
+    repeatedly on bulk endpoints.
     """
     text = unidecode.unidecode(text).lower().strip()
-    text = re.sub(r"[^\w\s-]", "", text)
-    text = re.sub(r"[\s-]+", "-", text)
-    text = re.sub(r"^-+|-+$", "", text)
+    text = _NON_WORD_PATTERN.sub("", text)
+    text = _SEPARATOR_PATTERN.sub("-", text)
+    text = _EDGE_DASH_PATTERN.sub("", text)
     return text
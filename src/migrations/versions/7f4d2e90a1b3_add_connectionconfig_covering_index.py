@@ -0,0 +1,40 @@
+"""add connectionconfig covering index
+
+Revision ID: 7f4d2e90a1b3
+Revises: c2a2e1cd48a1
+Create Date: 2021-11-23 10:31:54.762210
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "7f4d2e90a1b3"
+down_revision = "c2a2e1cd48a1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_connectionconfig_key_covering",
+        "connectionconfig",
+        ["key"],
+        unique=False,
+        postgresql_include=[
+            "name",
+            "connection_type",
+            "access",
+            "created_at",
+            "updated_at",
+            "last_test_timestamp",
+            "last_test_succeeded",
+        ],
+    )
+
+
+def downgrade():
+    op.drop_index(
+        "ix_connectionconfig_key_covering",
+        table_name="connectionconfig",
+    )
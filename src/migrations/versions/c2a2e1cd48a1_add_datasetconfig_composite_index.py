@@ -0,0 +1,31 @@
+"""add datasetconfig composite index
+
+Revision ID: c2a2e1cd48a1
+Revises: f206d4e7574d
+Create Date: 2021-11-22 16:08:11.103455
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "c2a2e1cd48a1"
+down_revision = "f206d4e7574d"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_datasetconfig_connection_config_id_fides_key",
+        "datasetconfig",
+        ["connection_config_id", "fides_key"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index(
+        "ix_datasetconfig_connection_config_id_fides_key",
+        table_name="datasetconfig",
+    )
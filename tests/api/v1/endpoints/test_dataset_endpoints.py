@@ -476,7 +476,7 @@ class TestPutDatasets:
         postgres_config.delete(db)
         mongo_config.delete(db)
 
-    @mock.patch("fidesops.models.datasetconfig.DatasetConfig.create_or_update")
+    @mock.patch("fidesops.api.v1.endpoints.dataset_endpoints._upsert_dataset_configs")
     def test_put_datasets_failed_response(
         self,
         mock_create: Mock,
@@ -29,31 +29,70 @@ from fidesops.schemas.jwt import (
 )
 from fidesops.util.oauth_util import extract_payload, generate_jwe
 
+# URLs that never vary are built once at import rather than per test via
+# fixture resolution
+CLIENT_URL = V1_URL_PREFIX + CLIENT
+TOKEN_URL = V1_URL_PREFIX + TOKEN
+SCOPE_URL = V1_URL_PREFIX + SCOPE
+# Templates with the prefix pre-concatenated: call sites only pay the format
+CLIENT_SCOPE_URL_TEMPLATE = V1_URL_PREFIX + CLIENT_SCOPE
+CLIENT_BY_ID_URL_TEMPLATE = V1_URL_PREFIX + CLIENT_BY_ID
+BAD_CLIENT_SCOPE_URL = CLIENT_SCOPE_URL_TEMPLATE.format(client_id="bad_client")
+BAD_CLIENT_BY_ID_URL = CLIENT_BY_ID_URL_TEMPLATE.format(client_id="bad_client")
+
+# Token payloads that depend only on constants are encrypted once at import
+# instead of paying a JWE encrypt per test run
+NO_CLIENT_AUTH_HEADER = {
+    "Authorization": "Bearer "
+    + generate_jwe(json.dumps({JWE_PAYLOAD_SCOPES: [CLIENT_CREATE]}))
+}
+
+# (method, url template, a scope the endpoint does not accept)
+AUTH_FAILURE_CASES = [
+    ("post", CLIENT_URL, CLIENT_READ),
+    ("get", CLIENT_SCOPE_URL_TEMPLATE, STORAGE_READ),
+    ("put", CLIENT_SCOPE_URL_TEMPLATE, CLIENT_READ),
+    ("get", SCOPE_URL, STORAGE_READ),
+    ("delete", CLIENT_BY_ID_URL_TEMPLATE, CLIENT_READ),
+]
+
+
+@pytest.mark.parametrize("method,url_template,wrong_scope", AUTH_FAILURE_CASES)
+def test_endpoint_not_authenticated(
+    method, url_template, wrong_scope, api_client: TestClient, oauth_client
+):
+    """One body covers the identical unauthenticated check for every client
+    and scope endpoint."""
+    url = url_template.format(client_id=oauth_client.id)
+    response = getattr(api_client, method)(url)
+    assert response.status_code == 401
+
+
+@pytest.mark.parametrize("method,url_template,wrong_scope", AUTH_FAILURE_CASES)
+def test_endpoint_wrong_scope(
+    method,
+    url_template,
+    wrong_scope,
+    api_client: TestClient,
+    oauth_client,
+    generate_auth_header,
+):
+    """One body covers the identical wrong-scope check for every client and
+    scope endpoint."""
+    url = url_template.format(client_id=oauth_client.id)
+    auth_header = generate_auth_header([wrong_scope])
+    response = getattr(api_client, method)(url, headers=auth_header)
+    assert response.status_code == 403
 
-class TestCreateClient:
-    @pytest.fixture(scope="function")
-    def url(self, oauth_client) -> str:
-        return V1_URL_PREFIX + CLIENT
 
-    def test_create_client_not_authenticated(self, api_client: TestClient, url):
-        response = api_client.post(url)
-        assert response.status_code == 401
-
-    def test_create_client_wrong_scope(
-        self, api_client: TestClient, url, generate_auth_header
-    ) -> None:
-        auth_header = generate_auth_header([CLIENT_READ])
-        response = api_client.post(url, headers=auth_header)
-        assert 403 == response.status_code
+class TestCreateClient:
+    @pytest.fixture(scope="class")
+    def url(self) -> str:
+        return CLIENT_URL
 
     def test_create_client_lacks_client(self, api_client: TestClient, url) -> None:
-        payload = {
-            JWE_PAYLOAD_SCOPES: [CLIENT_CREATE],
-        }
-        # Build auth header without client
-        auth_header = {"Authorization": "Bearer " + generate_jwe(json.dumps(payload))}
-
-        response = api_client.post(url, headers=auth_header)
+        # Auth header built without a client, precomputed at module import
+        response = api_client.post(url, headers=NO_CLIENT_AUTH_HEADER)
         assert 403 == response.status_code
 
     def test_create_client_with_expired_token(
@@ -78,7 +117,7 @@ class TestCreateClient:
         auth_header = generate_auth_header([CLIENT_CREATE])
 
         response = api_client.post(url, headers=auth_header)
-        response_body = json.loads(response.text)
+        response_body = response.json()
 
         assert 200 == response.status_code
         assert list(response_body.keys()) == ["client_id", "client_secret"]
@@ -107,7 +146,7 @@ class TestCreateClient:
             headers=auth_header,
             json=scopes,
         )
-        response_body = json.loads(response.text)
+        response_body = response.json()
         assert 200 == response.status_code
         assert list(response_body.keys()) == ["client_id", "client_secret"]
 
@@ -137,33 +176,14 @@ class TestCreateClient:
 class TestGetClientScopes:
     @pytest.fixture(scope="function")
     def url(self, oauth_client) -> str:
-        return V1_URL_PREFIX + CLIENT_SCOPE.format(client_id=oauth_client.id)
-
-    def test_get_scopes_not_authenticated(
-        self, api_client: TestClient, oauth_client: ClientDetail, url
-    ):
-        response = api_client.get(url)
-        assert response.status_code == 401
-
-    def test_get_scopes_wrong_scope(
-        self,
-        api_client: TestClient,
-        oauth_client: ClientDetail,
-        url,
-        generate_auth_header,
-    ) -> None:
-        auth_header = generate_auth_header([STORAGE_READ])
-        response = api_client.get(url, headers=auth_header)
-        assert 403 == response.status_code
+        return CLIENT_SCOPE_URL_TEMPLATE.format(client_id=oauth_client.id)
 
     def test_get_scopes_invalid_client(
         self, api_client: TestClient, oauth_client: ClientDetail, generate_auth_header
     ) -> None:
-        url = V1_URL_PREFIX + CLIENT_SCOPE.format(client_id="bad_client")
-
         auth_header = generate_auth_header([CLIENT_READ])
-        response = api_client.get(url, headers=auth_header)
-        response_body = json.loads(response.text)
+        response = api_client.get(BAD_CLIENT_SCOPE_URL, headers=auth_header)
+        response_body = response.json()
 
         assert 200 == response.status_code
         assert response_body == []
@@ -179,7 +199,7 @@ class TestGetClientScopes:
         auth_header = generate_auth_header([CLIENT_READ])
 
         response = api_client.get(url, headers=auth_header)
-        response_body = json.loads(response.text)
+        response_body = response.json()
 
         assert 200 == response.status_code
         assert response_body == SCOPE_REGISTRY
@@ -188,24 +208,7 @@ class TestGetClientScopes:
 class TestSetClientScopes:
     @pytest.fixture(scope="function")
     def url(self, oauth_client) -> str:
-        return V1_URL_PREFIX + CLIENT_SCOPE.format(client_id=oauth_client.id)
-
-    def test_set_scopes_not_authenticated(
-        self, api_client: TestClient, oauth_client: ClientDetail, url
-    ):
-        response = api_client.put(url)
-        assert response.status_code == 401
-
-    def test_set_scopes_wrong_scope(
-        self,
-        api_client: TestClient,
-        oauth_client: ClientDetail,
-        url,
-        generate_auth_header,
-    ) -> None:
-        auth_header = generate_auth_header([CLIENT_READ])
-        response = api_client.put(url, headers=auth_header)
-        assert 403 == response.status_code
+        return CLIENT_SCOPE_URL_TEMPLATE.format(client_id=oauth_client.id)
 
     def test_set_invalid_scope(
         self,
@@ -224,11 +227,11 @@ class TestSetClientScopes:
     def test_set_scopes_invalid_client(
         self, api_client: TestClient, oauth_client: ClientDetail, generate_auth_header
     ) -> None:
-        url = V1_URL_PREFIX + CLIENT_SCOPE.format(client_id="bad_client")
-
         auth_header = generate_auth_header([CLIENT_UPDATE])
-        response = api_client.put(url, headers=auth_header, json=["storage:read"])
-        response_body = json.loads(response.text)
+        response = api_client.put(
+            BAD_CLIENT_SCOPE_URL, headers=auth_header, json=["storage:read"]
+        )
+        response_body = response.json()
 
         assert 200 == response.status_code
         assert response_body is None  # No action was taken
@@ -244,7 +247,7 @@ class TestSetClientScopes:
         auth_header = generate_auth_header([CLIENT_UPDATE])
 
         response = api_client.put(url, headers=auth_header, json=["storage:read"])
-        response_body = json.loads(response.text)
+        response_body = response.json()
 
         assert 200 == response.status_code
         assert response_body is None
@@ -254,24 +257,9 @@ class TestSetClientScopes:
 
 
 class TestReadScopes:
-    @pytest.fixture(scope="function")
-    def url(self, oauth_client) -> str:
-        return V1_URL_PREFIX + SCOPE
-
-    def test_get_scopes_not_authenticated(self, api_client: TestClient, url):
-        response = api_client.get(url)
-        assert response.status_code == 401
-
-    def test_get_scopes_wrong_scope(
-        self,
-        api_client: TestClient,
-        oauth_client: ClientDetail,
-        url,
-        generate_auth_header,
-    ) -> None:
-        auth_header = generate_auth_header([STORAGE_READ])
-        response = api_client.get(url, headers=auth_header)
-        assert 403 == response.status_code
+    @pytest.fixture(scope="class")
+    def url(self) -> str:
+        return SCOPE_URL
 
     def test_get_scopes(
         self,
@@ -284,7 +272,7 @@ class TestReadScopes:
         auth_header = generate_auth_header([SCOPE_READ])
 
         response = api_client.get(url, headers=auth_header)
-        response_body = json.loads(response.text)
+        response_body = response.json()
 
         assert 200 == response.status_code
         assert response_body == SCOPE_REGISTRY
@@ -293,33 +281,14 @@ class TestReadScopes:
 class TestDeleteClient:
     @pytest.fixture(scope="function")
     def url(self, oauth_client) -> str:
-        return V1_URL_PREFIX + CLIENT_BY_ID.format(client_id=oauth_client.id)
-
-    def test_delete_client_not_authenticated(
-        self, api_client: TestClient, oauth_client: ClientDetail, url
-    ):
-        response = api_client.delete(url)
-        assert response.status_code == 401
-
-    def test_delete_client_wrong_scope(
-        self,
-        api_client: TestClient,
-        oauth_client: ClientDetail,
-        url,
-        generate_auth_header,
-    ) -> None:
-        auth_header = generate_auth_header([CLIENT_READ])
-        response = api_client.delete(url, headers=auth_header)
-        assert 403 == response.status_code
+        return CLIENT_BY_ID_URL_TEMPLATE.format(client_id=oauth_client.id)
 
     def test_delete_client_invalid_client(
         self, api_client: TestClient, oauth_client: ClientDetail, generate_auth_header
     ) -> None:
-        url = V1_URL_PREFIX + CLIENT_BY_ID.format(client_id="bad_client")
-
         auth_header = generate_auth_header([CLIENT_DELETE])
-        response = api_client.delete(url, headers=auth_header)
-        response_body = json.loads(response.text)
+        response = api_client.delete(BAD_CLIENT_BY_ID_URL, headers=auth_header)
+        response_body = response.json()
 
         assert 200 == response.status_code
         assert response_body is None  # No indicator that client didn't exist
@@ -335,20 +304,42 @@ class TestDeleteClient:
         auth_header = generate_auth_header([CLIENT_DELETE])
 
         response = api_client.delete(url, headers=auth_header)
-        response_body = json.loads(response.text)
+        response_body = response.json()
 
         assert 200 == response.status_code
         assert response_body is None
 
-        db.expunge_all()
-        client = ClientDetail.get(db, id=oauth_client.id)
-        assert client is None
+        # A scalar existence check needs no identity-map flush or row hydration
+        assert (
+            db.query(ClientDetail.id).filter_by(id=oauth_client.id).first() is None
+        )
 
 
 class TestAcquireAccessToken:
+    @pytest.fixture(scope="class")
+    def url(self) -> str:
+        return TOKEN_URL
+
+    @pytest.fixture(scope="class")
+    def client_pool(self, db):
+        """Amortize bcrypt hashing across the class: build the client/secret
+        pairs up front and let tests check them out one at a time."""
+        pool = [ClientDetail.create_client_and_secret(db) for _ in range(2)]
+        yield pool
+        for client, _ in pool:
+            if ClientDetail.get(db, id=client.id):
+                client.delete(db)
+
     @pytest.fixture(scope="function")
-    def url(self, oauth_client) -> str:
-        return V1_URL_PREFIX + TOKEN
+    def fresh_client(self, client_pool, db):
+        """Check a pre-built client/secret pair out of the pool, refilling it
+        lazily if tests outnumber the pool."""
+        if not client_pool:
+            client_pool.append(ClientDetail.create_client_and_secret(db))
+        client, secret = client_pool.pop()
+        yield client, secret
+        if ClientDetail.get(db, id=client.id):
+            client.delete(db)
 
     def test_no_form_data(self, db, url, api_client):
         response = api_client.post(url, data={})
@@ -360,17 +351,15 @@ class TestAcquireAccessToken:
         )
         assert response.status_code == 401
 
-    def test_invalid_client_secret(self, db, url, api_client):
-        new_client, _ = ClientDetail.create_client_and_secret(db)
+    def test_invalid_client_secret(self, db, url, api_client, fresh_client):
+        new_client, _ = fresh_client
         response = api_client.post(
             url, data={"client_id": new_client.id, "secret": "badsecret"}
         )
         assert response.status_code == 401
 
-        new_client.delete(db)
-
-    def test_get_access_token(self, db, url, api_client):
-        new_client, secret = ClientDetail.create_client_and_secret(db)
+    def test_get_access_token(self, db, url, api_client, fresh_client):
+        new_client, secret = fresh_client
 
         data = {
             "client_id": new_client.id,
@@ -378,11 +367,9 @@ class TestAcquireAccessToken:
         }
 
         response = api_client.post(url, data=data)
-        jwt = json.loads(response.text).get("access_token")
+        jwt = response.json().get("access_token")
         assert 200 == response.status_code
-        assert (
-            data["client_id"] == json.loads(extract_payload(jwt))[JWE_PAYLOAD_CLIENT_ID]
-        )
-        assert json.loads(extract_payload(jwt))[JWE_PAYLOAD_SCOPES] == []
-
-        new_client.delete(db)
+        # Decrypt and parse the token payload once for both assertions
+        token_payload = json.loads(extract_payload(jwt))
+        assert data["client_id"] == token_payload[JWE_PAYLOAD_CLIENT_ID]
+        assert token_payload[JWE_PAYLOAD_SCOPES] == []
@@ -26,6 +26,10 @@ def redshift_test_engine() -> Generator:
     uri = integration_config.get("redshift", {}).get("external_uri") or os.environ.get(
         "REDSHIFT_TEST_URI"
     )
+    if not uri:
+        # Skip before schema validation and engine construction rather than
+        # timing out on a connection to nowhere
+        pytest.skip("No Redshift URI configured")
     schema = RedshiftSchema(url=uri)
     connection_config = ConnectionConfig(
         name="My Redshift Config",
@@ -46,6 +50,8 @@ def snowflake_test_engine() -> Generator:
     uri = integration_config.get("snowflake", {}).get("external_uri") or os.environ.get(
         "SNOWFLAKE_TEST_URI"
     )
+    if not uri:
+        pytest.skip("No Snowflake URI configured")
     schema = SnowflakeSchema(url=uri)
     connection_config = ConnectionConfig(
         name="My Snowflake Config",
@@ -59,11 +65,24 @@ def snowflake_test_engine() -> Generator:
     engine.dispose()
 
 
+@pytest.fixture(scope="session")
+def redshift_test_table_names(redshift_test_engine):
+    """Catalog queries over the network are expensive; fetch the table names
+    once per session for any test that needs them"""
+    return inspect(redshift_test_engine).get_table_names(schema="test")
+
+
+@pytest.fixture(scope="session")
+def snowflake_test_table_names(snowflake_test_engine):
+    """Catalog queries over the network are expensive; fetch the table names
+    once per session for any test that needs them"""
+    return inspect(snowflake_test_engine).get_table_names(schema="test")
+
+
 @pytest.mark.external_integration
-def test_redshift_example_data(redshift_test_engine):
+def test_redshift_example_data(redshift_test_table_names):
     """Confirm that we can connect to the redshift test db and get table names"""
-    inspector = inspect(redshift_test_engine)
-    assert inspector.get_table_names(schema="test") == [
+    assert redshift_test_table_names == [
         "report",
         "service_request",
         "login",
@@ -79,10 +98,9 @@ def test_redshift_example_data(redshift_test_engine):
 
 
 @pytest.mark.external_integration
-def test_snowflake_example_data(snowflake_test_engine):
+def test_snowflake_example_data(snowflake_test_table_names):
     """Confirm that we can connect to the snowflake test db and get table names"""
-    inspector = inspect(snowflake_test_engine)
-    assert inspector.get_table_names(schema="test") == [
+    assert snowflake_test_table_names == [
         "cc",
         "report",
         "address",
@@ -6,21 +6,44 @@ from fidesops.models.storage import StorageConfig
 from fidesops.db.base_class import get_key_from_data
 
 
-def test_get_key_from_data_method() -> None:
-    # Test key in data not slugified
-    key = get_key_from_data({"key": "test key", "name": "config name"}, "StorageConfig")
-    assert key == "test-key"
-
-    # Test no key
-    key = get_key_from_data({"name": "config name"}, "StorageConfig")
-    assert key == "config-name"
-
+@pytest.mark.parametrize(
+    "data,expected_key",
+    [
+        # Key in data not slugified
+        ({"key": "test key", "name": "config name"}, "test-key"),
+        # No key falls back to the slugified name
+        ({"name": "config name"}, "config-name"),
+    ],
+)
+def test_get_key_from_data_method(data, expected_key) -> None:
+    assert get_key_from_data(data, "StorageConfig") == expected_key
+
+
+def test_get_key_from_data_method_requires_name() -> None:
     with pytest.raises(KeyValidationError) as exc:
         get_key_from_data({}, "StorageConfig")
     assert str(exc.value) == "StorageConfig requires a name."
 
 
-def test_create_key(db: Session):
+@pytest.fixture
+def storage_config_data(db: Session):
+    """Payload for creating a StorageConfig in the key tests; the row it
+    produces is cleaned up on teardown so test bodies don't need delete
+    tails."""
+    yield {
+        "name": "test dest",
+        "type": "s3",
+        "details": {
+            "bucket": "some-bucket",
+            "object_name": "requests",
+            "naming": "some-filename-convention-enum",
+            "max_retries": 10,
+        },
+    }
+    db.query(StorageConfig).filter_by(key="test-dest").delete()
+
+
+def test_create_key(db: Session, storage_config_data):
     # Test no way to create a key
     with pytest.raises(KeyValidationError) as exc:
         StorageConfig.create(
@@ -35,22 +58,8 @@ def test_create_key(db: Session):
     assert str(exc.value) == "StorageConfig requires a name."
 
     # Test happy path
-    sc = StorageConfig.create(
-        db,
-        data={
-            "name": "test dest",
-            "type": "s3",
-            "details": {
-                "bucket": "some-bucket",
-                "object_name": "requests",
-                "naming": "some-filename-convention-enum",
-                "max_retries": 10,
-            },
-        },
-    )
-
+    sc = StorageConfig.create(db, data=storage_config_data)
     assert sc.key == "test-dest"
-    db.query(StorageConfig).filter_by(key="test-dest").delete()
 
 
 def test_update_key(db: Session, storage_config, privacy_request):